@@ -1,75 +1,194 @@
 """Helper functions for economic correlation visualization."""
 
+import glob
+import hashlib
+import io
 import os
 import pickle
+import threading
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+import joblib
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import requests
 from plotly.subplots import make_subplots
 import yfinance as yf
-import pandas_datareader.data as web
 from datetime import datetime, timedelta
 
 # Default date range for data fetching
 DEFAULT_START_DATE = datetime(1960, 1, 1)
 DEFAULT_CACHE_DIR = "data_cache"
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+
+# yf.download keeps per-call results in module-level state, so concurrent
+# calls from the loader threads must not overlap.
+_YF_LOCK = threading.Lock()
+
+# Loaders print progress from worker threads; the lock keeps lines whole
+_PRINT_LOCK = threading.Lock()
+
+# Shared FRED session so the yield and recession downloads reuse connections
+# (the underlying urllib3 connection pool is thread-safe)
+_FRED_SESSION = requests.Session()
+
+# Pickle caches use protocol 5 and large buffered file I/O
+PICKLE_PROTOCOL = 5
+_IO_BUFFER_SIZE = 1024 * 1024
+
+# In-process memo of loaded caches, keyed by (cache_dir, cache_file)
+_MEM_CACHE = {}
+
+# Cache files the combined snapshot is derived from
+_SOURCE_CACHE_FILES = (
+    "nasdaq.joblib",
+    "sp500.joblib",
+    "CMO-Historical-Data-Monthly.xlsx",
+    "yf_gold.joblib",
+    "yf_silver.joblib",
+    "yields.feather",
+    "recessions.feather",
+)
+
+
+def _print(message):
+    """Print one line without interleaving with other loader threads."""
+    with _PRINT_LOCK:
+        print(message, flush=True)
+
+
+def _read_cache(cache_path, fmt):
+    """Read a cached object written by `_write_cache`."""
+    if fmt == 'feather':
+        df = pd.read_feather(cache_path)
+        return df.set_index(df.columns[0])
+    if fmt == 'parquet':
+        df = pd.read_parquet(cache_path)
+        return df.set_index(df.columns[0])
+    if fmt == 'joblib':
+        # Copy-on-write memory map: pages are read lazily and stay writable
+        return joblib.load(cache_path, mmap_mode='c')
+    with open(cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        return pickle.load(f)
+
+
+def _write_cache(data, cache_path, fmt):
+    """Write a downloaded object to the cache in the given format."""
+    if fmt in ('feather', 'parquet'):
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+        if fmt == 'feather':
+            data.reset_index().to_feather(cache_path)
+        else:
+            data.reset_index().to_parquet(cache_path, compression='zstd')
+        return
+    if fmt == 'joblib':
+        # Left uncompressed, since joblib cannot memory-map compressed files
+        joblib.dump(data, cache_path)
+        return
+    with open(cache_path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+        pickle.dump(data, f, protocol=PICKLE_PROTOCOL)
+
+
+def load_or_download(cache_file, download_func, description, cache_dir=DEFAULT_CACHE_DIR, verbose=True, fmt='pickle'):
+    """
+    Load from cache if exists, otherwise download and cache.
 
+    Tabular data should use fmt='feather' (or 'parquet'), which is stored with
+    the index as the first column and is much faster to read back than pickle.
+    fmt='joblib' memory-maps NumPy-backed data so it is paged in lazily.
+    Pickle remains the default for arbitrary objects.
 
-def load_or_download(cache_file, download_func, description, cache_dir=DEFAULT_CACHE_DIR, verbose=True):
-    """Load from cache if exists, otherwise download and cache."""
+    Loaded objects are also kept in memory, so later calls in the same process
+    skip reading the file. Deleting the cache file still forces a re-download.
+    joblib caches are not memoized: they are memory-mapped, and holding the
+    map would keep the file open (blocking deletion on Windows).
+    """
+    if fmt not in ('feather', 'parquet', 'joblib', 'pickle'):
+        raise ValueError(f"Unknown cache format: {fmt}")
+    key = (cache_dir, cache_file)
     os.makedirs(cache_dir, exist_ok=True)
     cache_path = os.path.join(cache_dir, cache_file)
     if os.path.exists(cache_path):
-        with open(cache_path, 'rb') as f:
-            return pickle.load(f)
+        if key in _MEM_CACHE:
+            return _MEM_CACHE[key]
+        data = _read_cache(cache_path, fmt)
     else:
         if verbose:
-            print(f"  Downloading {description}...")
+            _print(f"  Downloading {description}...")
         data = download_func()
-        with open(cache_path, 'wb') as f:
-            pickle.dump(data, f)
-        return data
+        _write_cache(data, cache_path, fmt)
+    if fmt != 'joblib':
+        _MEM_CACHE[key] = data
+    return data
 
 
-def get_recession_periods(df):
-    """Find contiguous recession periods for shading."""
-    if 'Recession' not in df.columns:
+def _contiguous_periods(index, mask, max_gap=pd.Timedelta(days=45)):
+    """Return (start, end) pairs for runs of flagged dates, splitting on gaps > max_gap."""
+    dates = index[mask]
+    if len(dates) == 0:
         return []
 
-    rec = df[df['Recession'] == 1]
-    if len(rec) == 0:
-        return []
+    breaks = np.diff(dates.values) > max_gap.to_timedelta64()
+    starts = dates[np.r_[True, breaks]]
+    ends = dates[np.r_[breaks, True]]
+    return list(zip(starts, ends))
 
-    periods = []
-    rec_dates = rec.index.to_series()
-    gaps = rec_dates.diff() > pd.Timedelta(days=45)
-    groups = gaps.cumsum()
 
-    for group_id in groups.unique():
-        group_dates = rec_dates[groups == group_id]
-        periods.append((group_dates.iloc[0], group_dates.iloc[-1]))
+def _pct_change(series, periods=6):
+    """
+    Percent change over `periods` rows, computed directly on the underlying array.
 
-    return periods
+    Interior NaNs are forward-filled first, like pct_change's default
+    fill_method='pad' in pandas 2.x.
+    """
+    values = series.to_numpy(dtype=float)
+    last_valid = np.where(np.isnan(values), 0, np.arange(len(values)))
+    values = values[np.maximum.accumulate(last_valid)]
+    out = np.full(values.shape, np.nan)
+    if len(values) > periods:
+        np.divide(values[periods:], values[:-periods], out=out[periods:])
+        out[periods:] -= 1.0
+        out[periods:] *= 100.0
+    return pd.Series(out, index=series.index, name=series.name)
 
 
-def get_inversion_periods(df, spread_col='Yield Spread'):
-    """Find contiguous yield curve inversion periods."""
-    inverted = df[df[spread_col] < 0]
-    if len(inverted) == 0:
+def _month_end_dates(months):
+    """Convert a datetime64[M] array to month-end datetime64[ns] dates."""
+    month_end = (months + np.timedelta64(1, 'M')).astype('datetime64[D]') - np.timedelta64(1, 'D')
+    return month_end.astype('datetime64[ns]')
+
+
+def _month_end(data, how='last'):
+    """
+    Aggregate daily data to month-end, equivalent to data.resample('ME').<how>().
+
+    Groups on an int64 months-since-epoch key rather than building a
+    TimeGrouper, then reindexes so empty months still appear as NaN rows.
+    """
+    month_key = data.index.values.astype('datetime64[M]').view(np.int64)
+    monthly = getattr(data.groupby(month_key), how)()
+    month_end = _month_end_dates(monthly.index.values.astype('datetime64[M]'))
+    monthly.index = pd.DatetimeIndex(month_end, name=data.index.name)
+    if len(monthly) == 0:
+        return monthly
+    return monthly.reindex(pd.date_range(monthly.index[0], monthly.index[-1], freq='ME', name=data.index.name))
+
+
+def get_recession_periods(df):
+    """Find contiguous recession periods for shading."""
+    if 'Recession' not in df.columns:
         return []
 
-    periods = []
-    inv_dates = inverted.index.to_series()
-    gaps = inv_dates.diff() > pd.Timedelta(days=45)
-    groups = gaps.cumsum()
+    return _contiguous_periods(df.index, df['Recession'].to_numpy() == 1)
 
-    for group_id in groups.unique():
-        group_dates = inv_dates[groups == group_id]
-        periods.append((group_dates.iloc[0], group_dates.iloc[-1]))
 
-    return periods
+def get_inversion_periods(df, spread_col='Yield Spread'):
+    """Find contiguous yield curve inversion periods."""
+    return _contiguous_periods(df.index, df[spread_col].to_numpy() < 0)
 
 
 def enable_unified_spikeline(fig, num_rows, date_range, spike_color='rgba(255, 255, 255, 0.5)'):
@@ -120,21 +239,25 @@ def enable_unified_spikeline(fig, num_rows, date_range, spike_color='rgba(255, 2
     fig.update_xaxes(**spike_settings)
 
 
+def _yf_download_close(symbol, start, end):
+    """Download daily Close prices for a Yahoo Finance symbol as a float32 DataFrame."""
+    with _YF_LOCK:
+        data = yf.download(symbol, start=start, end=end, progress=False)
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+    return data[['Close']].astype(np.float32)
+
+
 def load_nasdaq_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR):
     """Load NASDAQ data, downloading if not cached."""
     start_date = start_date or DEFAULT_START_DATE
     end_date = end_date or datetime.now()
 
-    def download():
-        data = yf.download("^IXIC", start=start_date, end=end_date, progress=False)
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
-        return data
-
-    nasdaq = load_or_download("nasdaq.pkl", download, "NASDAQ", cache_dir)
+    download = partial(_yf_download_close, "^IXIC", start_date, end_date)
+    nasdaq = load_or_download("nasdaq.joblib", download, "NASDAQ", cache_dir, fmt='joblib')
     nasdaq_price = nasdaq['Close']
-    nasdaq_monthly = nasdaq_price.resample('ME').last()
-    nasdaq_pct = nasdaq_monthly.pct_change(periods=6) * 100
+    nasdaq_monthly = _month_end(nasdaq_price)
+    nasdaq_pct = _pct_change(nasdaq_monthly)
     return nasdaq, nasdaq_monthly, nasdaq_pct
 
 
@@ -143,19 +266,29 @@ def load_sp500_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR)
     start_date = start_date or DEFAULT_START_DATE
     end_date = end_date or datetime.now()
 
-    def download():
-        data = yf.download("^GSPC", start=start_date, end=end_date, progress=False)
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
-        return data
-
-    sp500 = load_or_download("sp500.pkl", download, "S&P 500", cache_dir)
+    download = partial(_yf_download_close, "^GSPC", start_date, end_date)
+    sp500 = load_or_download("sp500.joblib", download, "S&P 500", cache_dir, fmt='joblib')
     sp500_price = sp500['Close']
-    sp500_monthly = sp500_price.resample('ME').last()
-    sp500_pct = sp500_monthly.pct_change(periods=6) * 100
+    sp500_monthly = _month_end(sp500_price)
+    sp500_pct = _pct_change(sp500_monthly)
     return sp500, sp500_monthly, sp500_pct
 
 
+def _parse_world_bank_prices(wb_file):
+    """Parse monthly Gold and Silver prices from the World Bank CMO workbook."""
+    wb_data = pd.read_excel(wb_file, sheet_name='Monthly Prices', header=4)
+    wb_data = wb_data.iloc[1:]  # Skip the units row
+    # Labels look like "1960M01"; parse them straight to datetime64[M]
+    labels = wb_data.iloc[:, 0].fillna('NaT').to_numpy(dtype=str)
+    wb_data['Date'] = _month_end_dates(np.char.replace(labels, 'M', '-').astype('datetime64[M]'))
+    wb_data = wb_data.set_index('Date')
+
+    return pd.DataFrame({
+        'Gold': pd.to_numeric(wb_data['Gold'], errors='coerce'),
+        'Silver': pd.to_numeric(wb_data['Silver'], errors='coerce'),
+    })
+
+
 def load_gold_silver_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR):
     """Load Gold and Silver data from World Bank (historical) and Yahoo Finance (recent)."""
     start_date = start_date or DEFAULT_START_DATE
@@ -172,65 +305,63 @@ def load_gold_silver_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACH
     try:
         # Load World Bank historical data
         if not os.path.exists(wb_file):
-            print("  Downloading World Bank commodity data...")
+            _print("  Downloading World Bank commodity data...")
             os.makedirs(cache_dir, exist_ok=True)
             urllib.request.urlretrieve(wb_url, wb_file)
 
-        wb_data = pd.read_excel(wb_file, sheet_name='Monthly Prices', header=4)
-        wb_data = wb_data.iloc[1:]  # Skip the units row
-        wb_data['Date'] = pd.to_datetime(wb_data.iloc[:, 0].str.replace('M', '-'), format='%Y-%m') + pd.offsets.MonthEnd(0)
-        wb_data = wb_data.set_index('Date')
+        # Parsing the workbook is slow, so reuse the parsed prices until the xlsx changes
+        wb_parsed_file = os.path.join(cache_dir, "wb_parsed.feather")
+        if os.path.exists(wb_parsed_file) and os.path.getmtime(wb_parsed_file) >= os.path.getmtime(wb_file):
+            wb_prices = _read_cache(wb_parsed_file, 'feather')
+        else:
+            wb_prices = _parse_world_bank_prices(wb_file)
+            _write_cache(wb_prices, wb_parsed_file, 'feather')
 
-        wb_gold = pd.to_numeric(wb_data['Gold'], errors='coerce')
-        wb_silver = pd.to_numeric(wb_data['Silver'], errors='coerce')
-        wb_end_date = wb_gold.dropna().index[-1]
+        wb_gold = wb_prices['Gold']
+        wb_silver = wb_prices['Silver']
+        wb_end_date = wb_gold.last_valid_index()
 
         # Get recent data from Yahoo Finance to fill the gap
+        download_yf_gold = partial(_yf_download_close, "GC=F", wb_end_date, end_date)
+        download_yf_silver = partial(_yf_download_close, "SI=F", wb_end_date, end_date)
 
-        def download_yf_gold():
-            data = yf.download("GC=F", start=wb_end_date, end=end_date, progress=False)
-            if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.get_level_values(0)
-            return data
-
-        def download_yf_silver():
-            data = yf.download("SI=F", start=wb_end_date, end=end_date, progress=False)
-            if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.get_level_values(0)
-            return data
-
-        yf_gold = load_or_download("yf_gold.pkl", download_yf_gold, "Yahoo Finance Gold", cache_dir)
-        yf_silver = load_or_download("yf_silver.pkl", download_yf_silver, "Yahoo Finance Silver", cache_dir)
+        yf_gold = load_or_download("yf_gold.joblib", download_yf_gold, "Yahoo Finance Gold", cache_dir, fmt='joblib')
+        yf_silver = load_or_download("yf_silver.joblib", download_yf_silver, "Yahoo Finance Silver", cache_dir, fmt='joblib')
 
         # Convert Yahoo Finance to monthly
-        yf_gold_monthly = yf_gold['Close'].resample('ME').last()
-        yf_silver_monthly = yf_silver['Close'].resample('ME').last()
+        yf_gold_monthly = _month_end(yf_gold['Close'])
+        yf_silver_monthly = _month_end(yf_silver['Close'])
 
         # Combine: use World Bank for historical, Yahoo Finance for recent
-        gold_monthly = wb_gold.copy()
-        silver_monthly = wb_silver.copy()
+        yf_gold_recent = yf_gold_monthly[yf_gold_monthly.index > wb_end_date].dropna()
+        yf_silver_recent = yf_silver_monthly[yf_silver_monthly.index > wb_end_date].dropna()
+        gold_monthly = yf_gold_recent.combine_first(wb_gold).sort_index()
+        silver_monthly = yf_silver_recent.combine_first(wb_silver).sort_index()
 
-        for date in yf_gold_monthly.index:
-            if date > wb_end_date and pd.notna(yf_gold_monthly[date]):
-                gold_monthly[date] = yf_gold_monthly[date]
-
-        for date in yf_silver_monthly.index:
-            if date > wb_end_date and pd.notna(yf_silver_monthly[date]):
-                silver_monthly[date] = yf_silver_monthly[date]
-
-        gold_monthly = gold_monthly.sort_index()
-        silver_monthly = silver_monthly.sort_index()
-
-        gold_pct = gold_monthly.pct_change(periods=6) * 100
-        silver_pct = silver_monthly.pct_change(periods=6) * 100
+        gold_pct = _pct_change(gold_monthly)
+        silver_pct = _pct_change(silver_monthly)
 
         return gold_monthly, gold_pct, silver_monthly, silver_pct
 
     except Exception as e:
-        print(f"Warning: Could not load Gold/Silver data: {e}")
+        _print(f"Warning: Could not load Gold/Silver data: {e}")
         return pd.Series(dtype=float), pd.Series(dtype=float), pd.Series(dtype=float), pd.Series(dtype=float)
 
 
+def _fred_download(series_ids, start_date, end_date):
+    """Download FRED series in a single CSV request, one column per series id."""
+    # Dates may arrive as strings, datetimes or Timestamps, as yf.download accepts
+    start_date, end_date = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    start, end = f"{start_date:%Y-%m-%d}", f"{end_date:%Y-%m-%d}"
+    url = (f"{FRED_CSV_URL}?id={','.join(series_ids)}"
+           f"&cosd={','.join([start] * len(series_ids))}&coed={','.join([end] * len(series_ids))}")
+    response = _FRED_SESSION.get(url, timeout=30)
+    response.raise_for_status()
+    data = pd.read_csv(io.BytesIO(response.content), index_col=0, parse_dates=True, na_values=['.'])
+    data.index.name = 'DATE'
+    return data.loc[start_date:end_date, series_ids]
+
+
 def load_yield_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR):
     """Load Treasury yield data from FRED."""
     start_date = start_date or DEFAULT_START_DATE
@@ -238,19 +369,29 @@ def load_yield_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR)
 
     def download():
         series = {'DGS2': '2Y Treasury', 'DGS10': '10Y Treasury', 'DGS3MO': '3M Treasury', 'DGS30': '30Y Treasury'}
-        data = {}
-        for series_id, name in series.items():
-            try:
-                df = web.DataReader(series_id, 'fred', start_date, end_date)
-                data[name] = df[series_id]
-            except Exception as e:
-                print(f"  Warning: Could not download {name}: {e}")
-        return pd.DataFrame(data)
-
-    yields_df = load_or_download("yields.pkl", download, "Treasury yields from FRED", cache_dir)
-    yields_df['10Y-2Y Spread'] = yields_df['10Y Treasury'] - yields_df['2Y Treasury']
-    yields_df['10Y-3M Spread'] = yields_df['10Y Treasury'] - yields_df['3M Treasury']
-    yields_monthly = yields_df.resample('ME').last()
+        try:
+            data = _fred_download(list(series), start_date, end_date)
+        except Exception as e:
+            # Retry one series at a time so a single failure only drops that column
+            _print(f"  Warning: Batched FRED download failed, retrying per series: {e}")
+            columns = {}
+            for series_id, name in series.items():
+                try:
+                    columns[series_id] = _fred_download([series_id], start_date, end_date)[series_id]
+                except Exception as e:
+                    _print(f"  Warning: Could not download {name}: {e}")
+            data = pd.DataFrame(columns)
+        return data.rename(columns=series)
+
+    yields_df = load_or_download("yields.feather", download, "Treasury yields from FRED", cache_dir, fmt='feather')
+    # Subtract the raw arrays and attach both spreads in one assign; assign also
+    # returns a new frame, leaving the memoized cache object untouched
+    ten_year = yields_df['10Y Treasury'].to_numpy()
+    yields_df = yields_df.assign(**{
+        '10Y-2Y Spread': ten_year - yields_df['2Y Treasury'].to_numpy(),
+        '10Y-3M Spread': ten_year - yields_df['3M Treasury'].to_numpy(),
+    })
+    yields_monthly = _month_end(yields_df)
     return yields_df, yields_monthly
 
 
@@ -260,48 +401,96 @@ def load_recession_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_
     end_date = end_date or datetime.now()
 
     def download():
-        return web.DataReader('USREC', 'fred', start_date, end_date)
+        return _fred_download(['USREC'], start_date, end_date)
 
     try:
-        recessions = load_or_download("recessions.pkl", download, "recession data from FRED", cache_dir)
-        recessions_monthly = recessions.resample('ME').max()
+        recessions = load_or_download("recessions.feather", download, "recession data from FRED", cache_dir, fmt='feather')
+        # USREC is a 0/1 flag, so store it as uint8 rather than float64
+        recessions_monthly = _month_end(recessions, 'max').fillna(0).astype(np.uint8)
         return recessions, recessions_monthly
     except Exception as e:
-        print(f"Warning: Could not load recession data: {e}")
+        _print(f"Warning: Could not load recession data: {e}")
         return None, None
 
 
-def load_all_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR):
-    """Load all economic data and combine into a single DataFrame."""
-    start_date = start_date or DEFAULT_START_DATE
-    end_date = end_date or datetime.now()
-
-    os.makedirs(cache_dir, exist_ok=True)
-    print("Loading data (from cache if available)...")
-
-    # Load all data sources
-    nasdaq, nasdaq_monthly, nasdaq_pct = load_nasdaq_data(start_date, end_date, cache_dir)
-    sp500, sp500_monthly, sp500_pct = load_sp500_data(start_date, end_date, cache_dir)
-    gold_monthly, gold_pct, silver_monthly, silver_pct = load_gold_silver_data(start_date, end_date, cache_dir)
-    yields_df, yields_monthly = load_yield_data(start_date, end_date, cache_dir)
-    recessions, recessions_monthly = load_recession_data(start_date, end_date, cache_dir)
-
-    # Combine into single DataFrame
-    combined = pd.DataFrame({
+def _combined_snapshot_path(start_date, end_date, cache_dir):
+    """Path of the combined snapshot for this date range (one file per end day)."""
+    key = f"{start_date.isoformat()}|{end_date.date().isoformat()}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, f"combined_{digest}.parquet")
+
+
+def _snapshot_is_fresh(snapshot_path, cache_dir):
+    """True if the snapshot exists and is newer than every source cache file."""
+    if not os.path.exists(snapshot_path):
+        return False
+    snapshot_mtime = os.path.getmtime(snapshot_path)
+    for cache_file in _SOURCE_CACHE_FILES:
+        source_path = os.path.join(cache_dir, cache_file)
+        if not os.path.exists(source_path) or os.path.getmtime(source_path) > snapshot_mtime:
+            return False
+    return True
+
+
+def _write_snapshot(combined, snapshot_path, cache_dir):
+    """Write the combined snapshot, removing snapshots left from other date ranges."""
+    for old_path in glob.glob(os.path.join(cache_dir, "combined_*.parquet")):
+        if old_path != snapshot_path:
+            os.remove(old_path)
+    combined.to_parquet(snapshot_path, compression='zstd')
+
+
+def _combine_sources(start_date, end_date, cache_dir):
+    """Load every data source and merge them into the monthly combined DataFrame."""
+    # Load all data sources in parallel; they are independent and I/O-bound
+    loaders = (load_nasdaq_data, load_sp500_data, load_gold_silver_data, load_yield_data, load_recession_data)
+    with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+        futures = [pool.submit(loader, start_date, end_date, cache_dir) for loader in loaders]
+    nasdaq, nasdaq_monthly, nasdaq_pct = futures[0].result()
+    sp500, sp500_monthly, sp500_pct = futures[1].result()
+    gold_monthly, gold_pct, silver_monthly, silver_pct = futures[2].result()
+    yields_df, yields_monthly = futures[3].result()
+    recessions, recessions_monthly = futures[4].result()
+
+    # Combine into single DataFrame, aligning every column to one shared index
+    columns = {
         'NASDAQ 6M %': nasdaq_pct,
         'S&P 500 6M %': sp500_pct,
         'Yield Spread': yields_monthly['10Y-2Y Spread'],
         'Gold 6M %': gold_pct,
         'Silver 6M %': silver_pct
-    })
+    }
+    index = nasdaq_pct.index
+    for series in list(columns.values())[1:]:
+        index = index.union(series.index)
+    combined = pd.concat([series.reindex(index) for series in columns.values()], axis=1)
+    combined.columns = list(columns)
 
     # Add recession indicator
     if recessions_monthly is not None:
-        combined['Recession'] = recessions_monthly['USREC']
+        combined['Recession'] = recessions_monthly['USREC'].reindex(combined.index, fill_value=0).astype(np.uint8)
     else:
-        combined['Recession'] = 0
+        combined['Recession'] = np.uint8(0)
+
+    return combined.dropna(subset=['NASDAQ 6M %', 'Yield Spread'])
+
 
-    combined = combined.dropna(subset=['NASDAQ 6M %', 'Yield Spread'])
+def load_all_data(start_date=None, end_date=None, cache_dir=DEFAULT_CACHE_DIR):
+    """Load all economic data and combine into a single DataFrame."""
+    start_date = pd.Timestamp(start_date or DEFAULT_START_DATE)
+    end_date = pd.Timestamp(end_date or datetime.now())
+
+    # Create the cache dir before the loaders run concurrently
+    os.makedirs(cache_dir, exist_ok=True)
+    print("Loading data (from cache if available)...")
+
+    # Reuse the merged frame if none of its sources changed since it was written
+    snapshot_path = _combined_snapshot_path(start_date, end_date, cache_dir)
+    if _snapshot_is_fresh(snapshot_path, cache_dir):
+        combined = pd.read_parquet(snapshot_path)
+    else:
+        combined = _combine_sources(start_date, end_date, cache_dir)
+        _write_snapshot(combined, snapshot_path, cache_dir)
 
     print(f"Loaded {len(combined)} months of data ({combined.index[0].strftime('%Y-%m')} to {combined.index[-1].strftime('%Y-%m')})")
 